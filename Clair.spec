@@ -5,7 +5,7 @@ a = Analysis(
     ['clair.py'],
     pathex=[],
     binaries=[],
-    datas=[('categories.json', '.'), ('presets.json', '.')],
+    datas=[('categories.json', '.')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
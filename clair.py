@@ -1,17 +1,28 @@
 #!/usr/bin/env python3
-import sys, json, shutil
+import os, sys, json, shutil
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+from urllib.parse import unquote
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QFileDialog,
+    QApplication, QMainWindow, QWidget,
     QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QTableWidget, QTableWidgetItem, QHeaderView, QComboBox,
     QSpacerItem, QSizePolicy, QScrollArea, QGridLayout,
-    QInputDialog, QGroupBox, QCheckBox
+    QGroupBox, QCheckBox
 )
 from PySide6.QtGui import QPalette, QColor, QFont, QIcon
 from PySide6.QtCore import Qt, QTimer
 
+try:
+    import orjson                                      # optional fast JSON backend
+except ImportError:
+    orjson = None
+
 # --- CONFIGURATION & DEFAULTS ---
 CONFIG_PATH = Path(__file__).parent / "categories.json"  # path to save categories
 default_cats = {                                       # built-in default file categories
@@ -24,60 +35,193 @@ default_cats = {                                       # built-in default file c
 ordered_types    = ["Documents", "Images", "Videos", "Music", "Archives"]
 type_exts        = {t: default_cats[t] for t in ordered_types}         # per-type extension lists
 all_exts_grouped = {t: default_cats[t] for t in ordered_types}         # grouped for "All" view
+_ALL_FLAT        = [e for t in ordered_types for e in default_cats[t]]   # flattened "All" selection
+_ALL_BUILTIN_EXTS = frozenset(_ALL_FLAT)                                # for O(1) membership
 
 # custom extensions list (loaded/saved from categories.json → "custom_extensions")
 CUSTOM_EXTS = []
+_CUSTOM_SET = set()                                    # mirror of CUSTOM_EXTS for O(1) membership
+
+# --- CATEGORY SNAPSHOTS ---
+@dataclass(frozen=True, slots=True)
+class Categories:
+    # immutable category → extensions snapshot; edits build a new one, so presets
+    # and the window can share the same object without defensive copies
+    data: Mapping[str, tuple]
+
+    def __hash__(self):
+        # mappingproxy itself is unhashable; hash the (name, extensions tuple) pairs as a
+        # frozenset so that, like __eq__, the result ignores category order
+        return hash(frozenset(self.data.items()))
+
+    @classmethod
+    def from_dict(cls, cats):
+        return cls(MappingProxyType({k: tuple(v) for k, v in cats.items()}))
+
+    def with_category(self, name, exts):
+        # copy with one category added or replaced
+        d = dict(self.data)
+        d[name] = tuple(exts)
+        return Categories(MappingProxyType(d))
+
+    def without(self, name):
+        # copy with one category removed
+        return Categories(MappingProxyType({k: v for k, v in self.data.items() if k != name}))
+
+    def to_dict(self):
+        # plain JSON-serializable form
+        return {k: list(v) for k, v in self.data.items()}
+
+# --- JSON HELPERS ---
+def _json_dumps(data):
+    # serialize to UTF-8 bytes, using orjson when available
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+def _json_loads(raw):
+    # parse UTF-8 bytes, using orjson when available
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+_last_saved_hash = {}                                  # path → hash of the bytes last written
+
+def _write_json(path, data):
+    # atomically replace path with data (temp file + rename). The write is skipped only when
+    # these bytes were the last ones written AND the file on disk still holds them, so files
+    # deleted or hand-edited outside the app are always rewritten
+    raw = _json_dumps(data)
+    h = hash(raw)
+    if _last_saved_hash.get(path) == h:
+        try:
+            if path.read_bytes() == raw:
+                return
+        except OSError:
+            pass
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_bytes(raw)
+    os.replace(tmp, path)
+    _last_saved_hash[path] = h
 
 # --- LOAD / SAVE CATEGORY CONFIG ---
 def load_config():
     # read existing categories.json or initialize defaults
     if CONFIG_PATH.exists():
         try:
-            data = json.loads(CONFIG_PATH.read_text())
+            data = _json_loads(CONFIG_PATH.read_bytes())
             # Expect file format:
             # {
             #   "categories": { "Documents": [...], ... },
             #   "custom_extensions": [".dv", ...]
             # }
-            cats = data.get("categories", default_cats.copy())
+            cats = Categories.from_dict(data.get("categories", default_cats))
             CUSTOM_EXTS[:] = data.get("custom_extensions", [])
+            _CUSTOM_SET.clear()
+            _CUSTOM_SET.update(CUSTOM_EXTS)
             return cats
         except:
             pass
     # if no valid file, write defaults + empty custom list
-    save_config(default_cats, [])
-    return default_cats.copy()
+    cats = Categories.from_dict(default_cats)
+    save_config(cats, [])
+    return cats
 
 def save_config(cats, custom_exts=None):
     # write both categories and custom‐extension list back to categories.json
     if custom_exts is None:
         custom_exts = CUSTOM_EXTS
     data = {
-        "categories": cats,
+        "categories": cats.to_dict(),
         "custom_extensions": custom_exts
     }
-    CONFIG_PATH.write_text(json.dumps(data, indent=4))
+    _write_json(CONFIG_PATH, data)
 
 # --- PRESETS SUPPORT ---
-PRESETS_PATH = Path(__file__).parent / "presets.json"  # path to save presets
-
-def load_presets():
-    # load saved presets or fallback to Default
-    presets = {"Default": default_cats.copy()}
+PRESETS_DIR  = Path(__file__).parent / "presets"       # one <escaped name>.json file per preset
+PRESETS_PATH = Path(__file__).parent / "presets.json"  # legacy single-file presets (migrated once)
+
+_UNSAFE_FILE_CHARS = set('<>:"/\\|?*%') | {chr(c) for c in range(32)} | {chr(127)}
+_RESERVED_STEMS = {"CON", "PRN", "AUX", "NUL",
+                   *(f"COM{i}" for i in range(1, 10)), *(f"LPT{i}" for i in range(1, 10))}
+
+def _preset_file_name(name):
+    # reversible file name for a preset: only characters that are illegal in file names
+    # (and % itself) become %XX, so non-ASCII names stay readable and short; unquote() decodes
+    stem = "".join(f"%{ord(ch):02X}" if ch in _UNSAFE_FILE_CHARS else ch for ch in name)
+    if stem.split(".")[0].upper() in _RESERVED_STEMS:
+        stem = f"%{ord(stem[0]):02X}" + stem[1:]     # Windows device names can't be file names
+    return stem + ".json"
+
+def _preset_key(name):
+    # file identity of a preset: names that map to the same file on this OS collide
+    return os.path.normcase(_preset_file_name(name))
+
+def _preset_path(name):
+    return PRESETS_DIR / _preset_file_name(name)
+
+def _migrate_legacy_presets():
+    # split an old presets.json into per-preset files the first time the folder is created
+    PRESETS_DIR.mkdir(exist_ok=True)
     if PRESETS_PATH.exists():
         try:
-            presets.update(json.loads(PRESETS_PATH.read_text()))
+            for name, cats in _json_loads(PRESETS_PATH.read_bytes()).items():
+                if name != "Default":
+                    _write_json(_preset_path(name), cats)
         except:
             pass
+
+def load_presets():
+    # list saved presets without parsing them; values stay None until read_preset() is needed
+    presets = {"Default": Categories.from_dict(default_cats)}
+    if not PRESETS_DIR.is_dir():
+        _migrate_legacy_presets()
+    with os.scandir(PRESETS_DIR) as it:
+        for e in sorted(it, key=lambda e: e.name):
+            if e.is_file() and e.name.endswith(".json"):
+                presets.setdefault(unquote(e.name[:-5]), None)
     return presets
 
-def save_presets(user_presets):
-    # write user-defined presets
-    PRESETS_PATH.write_text(json.dumps(user_presets, indent=4))
+def read_preset(name):
+    # parse a single preset file; None if it is missing or malformed
+    try:
+        return Categories.from_dict(_json_loads(_preset_path(name).read_bytes()))
+    except:
+        return None
+
+def save_preset_file(name, cats):
+    # write only the affected preset
+    PRESETS_DIR.mkdir(exist_ok=True)
+    _write_json(_preset_path(name), cats.to_dict())
+
+def delete_preset_file(name):
+    # remove a preset's file (and forget its cached hash so a re-add is written)
+    path = _preset_path(name)
+    _last_saved_hash.pop(path, None)
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+def rename_preset_file(old, new, cats):
+    # move a preset's file to its new name; if the file is gone (deleted outside the app or
+    # never written), write the in-memory snapshot under the new name instead
+    src, dst = _preset_path(old), _preset_path(new)
+    _last_saved_hash.pop(src, None)
+    _last_saved_hash.pop(dst, None)
+    try:
+        os.replace(src, dst)
+    except FileNotFoundError:
+        if cats is not None:
+            save_preset_file(new, cats)
 
 # --- EXTENSION CHECKBOX WIDGET BUILDER ---
-def make_extension_widget(exts, selected, on_change):
-    # create scrollable checkboxes for extensions
+def make_extension_widget(exts, selected, on_change, table_row):
+    # create scrollable checkboxes for extensions; every box shares one on_change slot,
+    # which identifies the box via sender() and its "row" property.
+    # returns (widget, checkboxes) so callers never need findChildren()
+    selected = set(selected)                   # O(1) membership per checkbox
+    boxes = []
     widget = QWidget()
     layout = QVBoxLayout(widget)
     layout.setContentsMargins(0,0,0,0)
@@ -94,7 +238,9 @@ def make_extension_widget(exts, selected, on_change):
             for c, e in enumerate(exts[t]):
                 cb = QCheckBox(e)
                 cb.setChecked(e in selected)
-                cb.clicked.connect(lambda _, x=e: on_change(x))
+                cb.setProperty("row", table_row)
+                cb.clicked.connect(on_change)
+                boxes.append(cb)
                 grid.addWidget(cb, r, c)
 
         # add extra row after built-in types for any custom extensions
@@ -102,7 +248,9 @@ def make_extension_widget(exts, selected, on_change):
         for c, e in enumerate(CUSTOM_EXTS):
             cb = QCheckBox(e)
             cb.setChecked(e in selected)
-            cb.clicked.connect(lambda _, x=e: on_change(x))
+            cb.setProperty("row", table_row)
+            cb.clicked.connect(on_change)
+            boxes.append(cb)
             grid.addWidget(cb, custom_row, c)
 
         content.setLayout(grid)
@@ -114,14 +262,16 @@ def make_extension_widget(exts, selected, on_change):
         for e in exts:
             cb = QCheckBox(e)
             cb.setChecked(e in selected)
-            cb.clicked.connect(lambda _, x=e: on_change(x))
+            cb.setProperty("row", table_row)
+            cb.clicked.connect(on_change)
+            boxes.append(cb)
             row.addWidget(cb)
         row.addStretch()
         content.setLayout(row)
 
     scroll.setWidget(content)
     layout.addWidget(scroll)
-    return widget
+    return widget, boxes
 
 # --- MAIN APPLICATION WINDOW ---
 class MainWindow(QMainWindow):
@@ -132,6 +282,14 @@ class MainWindow(QMainWindow):
         self._setup_dark_theme()                   # apply dark theme
         self.cats    = load_config()               # current categories
         self.presets = load_presets()              # presets dictionary
+        self._row_checkboxes = {}                  # table row → its extension checkboxes
+        self._row_combos     = {}                  # table row → its current type combo
+
+        # coalesce rapid checkbox toggles into a single categories.json write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(lambda: save_config(self.cats, CUSTOM_EXTS))
 
         central = QWidget()
         main = QVBoxLayout(central)
@@ -251,50 +409,101 @@ class MainWindow(QMainWindow):
         QApplication.setFont(QFont("Segoe UI",10))
 
     def populate_table(self):
-        # rebuild table rows from self.cats
-        self.tbl.setRowCount(0)
-        for name, exts in self.cats.items():
-            r = self.tbl.rowCount()
-            self.tbl.insertRow(r)
-            self.tbl.setItem(r,0, QTableWidgetItem(name))
-
-            combo = QComboBox()
-            combo.addItems(["All"] + ordered_types)
-            combo.setCurrentText(name if name in ordered_types else "All")
-            combo.currentTextChanged.connect(lambda t,row=r: self.on_type_change(row,t))
-            combo.setSizeAdjustPolicy(QComboBox.AdjustToContents)
-            self.tbl.setCellWidget(r,1, combo)
-
-            w = make_extension_widget(
-                all_exts_grouped if combo.currentText()=="All" else type_exts[combo.currentText()],
-                exts,
-                lambda e,row=r: self.on_ext_change(row,e)
-            )
-            self.tbl.setCellWidget(r,2, w)
-            self.tbl.setRowHeight(r, 200 if combo.currentText()=="All" else 50)
+        # rebuild table rows from self.cats with repaints, signals and auto-resizing paused
+        hdr = self.tbl.horizontalHeader()
+        self.tbl.setUpdatesEnabled(False)
+        self.tbl.blockSignals(True)
+        self.tbl.setSortingEnabled(False)
+        hdr.setSectionResizeMode(0, QHeaderView.Fixed)
+        hdr.setSectionResizeMode(1, QHeaderView.Fixed)
+        try:
+            self.tbl.setRowCount(0)
+            self._row_checkboxes = {}
+            self._row_combos = {}
+            self.tbl.setRowCount(len(self.cats.data))   # pre-size, then fill by index
+            for r, (name, exts) in enumerate(self.cats.data.items()):
+                self._fill_row(r, name, exts)
+        finally:
+            # restoring ResizeToContents fits the columns once for all rows
+            hdr.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+            hdr.setSectionResizeMode(1, QHeaderView.ResizeToContents)
+            self.tbl.blockSignals(False)
+            self.tbl.setUpdatesEnabled(True)
+
+    def _append_row(self, name, exts):
+        # add a single category row at the bottom of the table
+        r = self.tbl.rowCount()
+        self.tbl.insertRow(r)
+        self._fill_row(r, name, exts)
+
+    def _fill_row(self, r, name, exts):
+        # populate the name, type and extensions cells of an existing row
+        self.tbl.setItem(r,0, QTableWidgetItem(name))
+
+        t = name if name in ordered_types else "All"
+        combo = QComboBox()
+        combo.addItems(["All"] + ordered_types)
+        combo.setCurrentText(t)
+        self._row_combos[r] = combo
+        # queued: the row rebuild runs after the signal has finished emitting
+        combo.currentTextChanged.connect(self._on_type_change_slot, Qt.QueuedConnection)
+        combo.setSizeAdjustPolicy(QComboBox.AdjustToContents)
+        self.tbl.setCellWidget(r,1, combo)
+
+        self._set_ext_cell(r, t, exts)
+
+    def _set_ext_cell(self, r, t, exts):
+        # (re)build only the extensions cell of a single row
+        w, self._row_checkboxes[r] = make_extension_widget(
+            all_exts_grouped if t=="All" else type_exts[t],
+            exts,
+            self._on_ext_clicked,
+            r
+        )
+        self.tbl.setCellWidget(r,2, w)
+        self.tbl.setRowHeight(r, 200 if t=="All" else 50)
+
+    def _on_type_change_slot(self, _text=None):
+        # shared slot for every type combo; the queued call may arrive after populate_table
+        # replaced the combo, so only act if the sender is still some row's current combo
+        # (identity check first: a replaced combo may already be deleted on the C++ side)
+        combo = self.sender()
+        row = next((r for r, c in self._row_combos.items() if c is combo), None)
+        if row is None:
+            return
+        self.on_type_change(row, combo.currentText())
 
     def on_type_change(self, row, t):
-        # update category when type dropdown changes
+        # update category when type dropdown changes; only this row is rebuilt
         nm = self.tbl.item(row,0).text()
-        default = all_exts_grouped if t=="All" else type_exts[t]
-        self.cats[nm] = default.copy()
-        save_config(self.cats, CUSTOM_EXTS)
-        self.populate_table()
+        new = _ALL_FLAT + CUSTOM_EXTS if t=="All" else list(type_exts[t])
+        if self.cats.data.get(nm) != tuple(new):  # skip the write when nothing changed
+            self.cats = self.cats.with_category(nm, new)
+            save_config(self.cats, CUSTOM_EXTS)
+        self._set_ext_cell(row, t, self.cats.data[nm])
+
+    def _on_ext_clicked(self, checked=False):
+        # shared slot for every extension checkbox
+        cb = self.sender()
+        self.on_ext_change(cb.property("row"), cb.text())
 
     def on_ext_change(self, row, ext):
         # update extension list when a checkbox toggles
         nm = self.tbl.item(row,0).text()
-        btns = self.tbl.cellWidget(row,2).findChildren(QCheckBox)
-        self.cats[nm] = [b.text() for b in btns if b.isChecked()]
-        save_config(self.cats, CUSTOM_EXTS)
+        btns = self._row_checkboxes[row]
+        self.cats = self.cats.with_category(nm, [b.text() for b in btns if b.isChecked()])
+        self._save_timer.start()                   # debounced save
 
     def add_category(self):
         # prompt and add new category
+        from PySide6.QtWidgets import QInputDialog
         txt, ok = QInputDialog.getText(self,"New Category","Category name:")
         if ok and txt.strip():
-            self.cats[txt.strip()] = []
+            if txt.strip() in self.cats.data:
+                return self.show_status(f"'{txt.strip()}' already exists.", True)
+            self.cats = self.cats.with_category(txt.strip(), ())
             save_config(self.cats, CUSTOM_EXTS)
-            self.populate_table()
+            self._append_row(txt.strip(), [])
             self.show_status(f"Added '{txt.strip()}'")
 
     def remove_category(self):
@@ -302,13 +511,14 @@ class MainWindow(QMainWindow):
         r = self.tbl.currentRow()
         if r>=0:
             nm = self.tbl.item(r,0).text()
-            self.cats.pop(nm, None)
+            self.cats = self.cats.without(nm)
             save_config(self.cats, CUSTOM_EXTS)
             self.populate_table()
             self.show_status(f"Removed '{nm}'")
 
     def choose_folder(self):
         # open folder dialog
+        from PySide6.QtWidgets import QFileDialog
         d = QFileDialog.getExistingDirectory(self,"Select Folder")
         if d:
             self.path.setText(d)
@@ -319,48 +529,63 @@ class MainWindow(QMainWindow):
         if not d:
             return self.show_status("Choose folder first.", True)
 
-        organize_folder(Path(d), self.cats, self.rec.isChecked())
+        organize_folder(Path(d), self.cats.data, self.rec.isChecked())
         if self.rec.isChecked() and self.del_empty.isChecked():
-            for sub in sorted(Path(d).rglob("*"), key=lambda p: len(str(p)), reverse=True):
-                if sub.is_dir() and not any(sub.iterdir()):
-                    sub.rmdir()
+            remove_empty_dirs(d)
         self.show_status(f"Organized {Path(d).name}.")
 
     def load_preset(self, name):
-        # load categories from selected preset
-        if name in self.presets:
-            self.cats = self.presets[name].copy()
+        # load categories from selected preset, reading its file on first use
+        if name in self.presets and self.presets[name] is None:
+            self.presets[name] = read_preset(name)
+            if self.presets[name] is None:
+                return self.show_status(f"Could not read preset '{name}'.", True)
+        if name in self.presets and self.presets[name] != self.cats:
+            self.cats = self.presets[name]         # immutable snapshot, shared without copying
             save_config(self.cats, CUSTOM_EXTS)
             self.populate_table()
 
     def add_preset(self):
         # create a brand-new preset with three empty, "All"-type categories
+        from PySide6.QtWidgets import QInputDialog
         default_name = datetime.now().strftime("Preset %Y-%m-%d %H-%M-%S")
         name, ok = QInputDialog.getText(self, "New Preset", "Preset name:", QLineEdit.Normal, default_name)
         if ok and name.strip():
-            new_cats = {
+            if self._preset_name_taken(name.strip()):
+                return self.show_status(f"A preset named '{name.strip()}' already exists.", True)
+            new_cats = Categories.from_dict({
                 "Category 1": [],
                 "Category 2": [],
                 "Category 3": []
-            }
-            self.presets[name.strip()] = new_cats.copy()
-            save_presets({k: v for k, v in self.presets.items() if k != "Default"})
+            })
+            # write the file first so a failed write leaves the presets untouched
+            try:
+                save_preset_file(name.strip(), new_cats)
+            except OSError as e:
+                return self.show_status(f"Could not save preset: {e.strerror or e}", True)
+            self.presets[name.strip()] = new_cats
             self.pcombo.addItem(name.strip())
             self.pcombo.setCurrentText(name.strip())
-            self.cats = new_cats.copy()
+            self.cats = new_cats
             save_config(self.cats, CUSTOM_EXTS)
             self.populate_table()
             self.show_status(f"Added preset '{name.strip()}'")
 
     def rename_preset(self):
         # rename currently selected preset
+        from PySide6.QtWidgets import QInputDialog
         cur = self.pcombo.currentText()
         if cur == "Default":
             return self.show_status("Cannot rename Default.", True)
         new, ok = QInputDialog.getText(self, "Rename Preset", "New name:", QLineEdit.Normal, cur)
         if ok and new.strip() and new.strip() != cur:
+            if self._preset_name_taken(new.strip(), ignore=cur):
+                return self.show_status(f"A preset named '{new.strip()}' already exists.", True)
+            try:
+                rename_preset_file(cur, new.strip(), self.presets.get(cur))
+            except OSError as e:
+                return self.show_status(f"Could not rename preset: {e.strerror or e}", True)
             self.presets[new.strip()] = self.presets.pop(cur)
-            save_presets({k: v for k, v in self.presets.items() if k != "Default"})
             idx = self.pcombo.currentIndex()
             self.pcombo.setItemText(idx, new.strip())
             self.pcombo.setCurrentText(new.strip())
@@ -371,8 +596,11 @@ class MainWindow(QMainWindow):
         cur = self.pcombo.currentText()
         if cur == "Default":
             return self.show_status("Use 'Add Preset' to create.", True)
-        self.presets[cur] = self.cats.copy()
-        save_presets({k: v for k, v in self.presets.items() if k != "Default"})
+        try:
+            save_preset_file(cur, self.cats)
+        except OSError as e:
+            return self.show_status(f"Could not save preset: {e.strerror or e}", True)
+        self.presets[cur] = self.cats
         self.show_status(f"Saved preset '{cur}'")
 
     def delete_preset(self):
@@ -380,15 +608,24 @@ class MainWindow(QMainWindow):
         cur = self.pcombo.currentText()
         if cur == "Default":
             return
+        try:
+            delete_preset_file(cur)
+        except OSError as e:
+            return self.show_status(f"Could not delete preset: {e.strerror or e}", True)
         self.presets.pop(cur, None)
-        save_presets({k: v for k, v in self.presets.items() if k != "Default"})
         self.pcombo.clear()
         self.pcombo.addItems(self.presets.keys())
         self.load_preset("Default")
         self.show_status(f"Deleted preset '{cur}'")
 
+    def _preset_name_taken(self, name, ignore=None):
+        # true if name would share a preset file with another preset (e.g. case-only on Windows)
+        key = _preset_key(name)
+        return any(_preset_key(n) == key for n in self.presets if n != ignore)
+
     def add_extension(self):
         # prompt user to add a new extension to the "All" grid
+        from PySide6.QtWidgets import QInputDialog
         ext, ok = QInputDialog.getText(self, "Add Extension", "Extension (include leading '.'):",
                                        QLineEdit.Normal, "")
         if not ok:
@@ -397,15 +634,23 @@ class MainWindow(QMainWindow):
         if not ext.startswith("."):
             ext = "." + ext
         # don’t duplicate either in custom or in any built-in type
-        if ext in CUSTOM_EXTS or any(ext in lst for lst in type_exts.values()):
+        if ext in _CUSTOM_SET or ext in _ALL_BUILTIN_EXTS:
             self.show_status(f"'{ext}' already exists.", True)
             return
         CUSTOM_EXTS.append(ext)
+        _CUSTOM_SET.add(ext)
         # now save both cats and custom exts into categories.json
         save_config(self.cats, CUSTOM_EXTS)
         self.populate_table()
         self.show_status(f"Added extension '{ext}' to All.")
 
+    def closeEvent(self, event):
+        # flush any pending debounced save before closing
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            save_config(self.cats, CUSTOM_EXTS)
+        super().closeEvent(event)
+
     def show_status(self, text, error=False):
         # display a temporary status message
         self.status.setText(text)
@@ -414,23 +659,111 @@ class MainWindow(QMainWindow):
         QTimer.singleShot(3000, lambda: self.status.setText(""))
 
 # --- ORGANIZATION LOGIC ---
-def organize_folder(folder: Path, cats: dict, recursive: bool):
-    # move files into folders based on extension categories
-    files = folder.rglob("*") if recursive else folder.iterdir()
-    for f in files:
-        if not f.is_file():
+def _walk(root, recursive=True, skip=()):
+    # iterative DFS yielding non-directory entries; DirEntry caches file type from readdir.
+    # folders whose normcased path is in skip are not descended into
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        if recursive and os.path.normcase(e.path) not in skip:
+                            stack.append(e.path)
+                    else:
+                        yield e
+        except PermissionError:
+            continue                      # unreadable folder: skip its subtree, like rglob
+
+def remove_empty_dirs(root):
+    # post-order walk removing empty subfolders bottom-up (root itself is kept);
+    # rmdir simply fails on non-empty folders, so no separate emptiness check is needed
+    stack = [(str(root), False)]
+    while stack:
+        path, visited = stack.pop()
+        if visited:
+            try:
+                os.rmdir(path)
+            except OSError:
+                pass
             continue
-        ext = f.suffix.lower()
-        for cat, exts in cats.items():
-            if ext in exts:
-                dest = folder / cat
-                dest.mkdir(exist_ok=True)
-                shutil.move(str(f), str(dest / f.name))
-                break
-        else:
-            oth = folder / "Others"
-            oth.mkdir(exist_ok=True)
-            shutil.move(str(f), str(oth / f.name))
+        if path != str(root):
+            stack.append((path, True))
+        try:
+            with os.scandir(path) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append((e.path, False))
+        except OSError:
+            pass
+
+def _move(src, dst):
+    # plain rename for the common same-filesystem case; shutil.move handles EXDEV and the rest
+    try:
+        os.rename(src, dst)
+    except OSError:
+        shutil.move(src, dst)
+
+def compile_organizer(folder, cats):
+    # specialize classification on one cats snapshot: returns (classify, dest_dirs) where
+    # classify(file name) → destination folder path, with everything it needs bound as locals
+    ext_map = {}                          # ext → category (first category listing an ext wins)
+    for cat, exts in cats.items():
+        for e in exts:
+            ext_map.setdefault(sys.intern(e.lower()), cat)   # interned keys: identity-fast lookups
+    dest_dirs = {cat: os.path.join(folder, cat) for cat in cats}
+    dest_dirs["Others"] = os.path.join(folder, "Others")
+    # fold the two lookups into one: ext → destination folder
+    ext_dest = {ext: dest_dirs[cat] for ext, cat in ext_map.items()}
+    others = dest_dirs["Others"]
+    intern = sys.intern
+
+    def classify(name):
+        # same extension rule as os.path.splitext: leading dots don't start an extension
+        i = name.rfind(".")
+        if i > 0 and (name[0] != "." or name[:i].lstrip(".")):
+            return ext_dest.get(intern(name[i:].lower()), others)
+        return ext_dest.get("", others)
+
+    return classify, dest_dirs
+
+def organize_folder(folder: Path, cats: Mapping, recursive: bool):
+    # move files into folders based on extension categories
+    classify, dest_dirs = compile_organizer(folder, cats)
+
+    # category folders are already organized: don't re-walk them or move files onto themselves
+    skip = {os.path.normcase(p) for p in dest_dirs.values()}   # case-folded like `taken` below
+
+    # first pass: scan and bucket every file by destination folder. A file whose target path
+    # is already claimed (same name from another subfolder) goes to a serial tail instead, so
+    # no two workers ever move onto the same dst; normcase folds case like Windows does
+    buckets = defaultdict(list)           # dest dir → [(src path, file name), ...]
+    taken = set()                         # normcased destination paths claimed by the pool
+    serial = []                           # (src path, dst path) moved one by one afterwards
+    for f in _walk(folder, recursive, skip):
+        if f.is_file():
+            dst_dir = classify(f.name)
+            key = os.path.normcase(dst_dir + os.sep + f.name)
+            if key in taken:
+                serial.append((f.path, dst_dir + os.sep + f.name))
+            else:
+                taken.add(key)
+                buckets[dst_dir].append((f.path, f.name))
+
+    # second pass: one mkdir per destination (in the main thread, so move workers never
+    # race on it), then that destination's moves back to back on the worker pool
+    futures = []
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+        for dst_dir, files in buckets.items():
+            os.makedirs(dst_dir, exist_ok=True)
+            prefix = dst_dir + os.sep
+            futures.extend(ex.submit(_move, src, prefix + name) for src, name in files)
+        for fut in futures:
+            fut.result()                  # re-raise any move error in the caller
+
+    # colliding names: same last-one-wins order as a plain serial loop
+    for src, dst in serial:
+        _move(src, dst)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)